@@ -6,34 +6,146 @@ food pool, and bounty pool features.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-import customtkinter as ctk
-import math
-from typing import List, Dict, Tuple
-
-# Set appearance mode and poker green color scheme
-ctk.set_appearance_mode("dark")
-ctk.set_default_color_theme("green")
-
-# Custom poker green colors
-POKER_COLORS = {
-    "dark_green": "#0D4F3C",      # Dark poker table green
-    "medium_green": "#1B5E20",    # Medium green
-    "light_green": "#2E7D32",     # Lighter green
-    "accent_green": "#4CAF50",    # Bright green accent
-    "felt_green": "#0A3D2E",      # Deep felt green
-    "gold": "#FFD700",            # Gold for highlights
-    "card_white": "#F5F5F5"       # Card white
-}
+import time
+from functools import lru_cache, partial
+
+# customtkinter is loaded lazily by _init_gui() so the pure calculation
+# helpers stay importable without paying the GUI toolkit's import cost
+ctk = None
+
+
+def _init_gui():
+    """Import customtkinter and apply the poker theme on first GUI use"""
+    global ctk
+    if ctk is not None:
+        return
+    import customtkinter as _ctk
+
+    # Set appearance mode and poker green color scheme
+    _ctk.set_appearance_mode("dark")
+    _ctk.set_default_color_theme("green")
+    ctk = _ctk
+
+# Custom poker green colors - plain class attributes, so each widget
+# construction pays a constant attribute load rather than a dict lookup
+class _PokerColors:
+    __slots__ = ()
+    dark_green = "#0D4F3C"      # Dark poker table green
+    medium_green = "#1B5E20"    # Medium green
+    light_green = "#2E7D32"     # Lighter green
+    accent_green = "#4CAF50"    # Bright green accent
+    felt_green = "#0A3D2E"      # Deep felt green
+    gold = "#FFD700"            # Gold for highlights
+    card_white = "#F5F5F5"      # Card white
+
+
+POKER_COLORS = _PokerColors()
+
+
+# Shared CTkFont instances - Tk allocates a font object per construction,
+# so reuse one per (size, weight) across the whole UI
+_FONT_CACHE = {}
+
+
+def _get_font(size, weight="normal"):
+    """Return a cached CTkFont for the given size and weight"""
+    key = (size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = ctk.CTkFont(size=size, weight=weight)
+    return font
+
+
+# Medal emojis for the top finishing positions (built once at import)
+_POSITION_EMOJIS = ("🥇", "🥈", "🥉") + ("🏅",) * 20
+_FALLBACK_EMOJI = "🏅"
+
+# Ordinal suffixes indexed by the last digit (4-9 and the teens are "th")
+_SUFFIXES = ("th", "st", "nd", "rd")
+
+
+def _suffix_for_mod100(m: int) -> str:
+    """Ordinal suffix for a position with the given value of position % 100"""
+    if 10 <= m <= 20:
+        return "th"
+    last_digit = m % 10
+    return _SUFFIXES[last_digit] if last_digit < 4 else "th"
+
+
+# Suffix for every residue of position % 100: the branchy teen/last-digit
+# logic runs once per entry at import, leaving a single table index at runtime
+_SUFFIX_BY_MOD100 = tuple(_suffix_for_mod100(m) for m in range(100))
+
+
+def _position_suffix(position: int) -> str:
+    """Format a position number with its ordinal suffix (1st, 2nd, ...)"""
+    return f"{position}{_SUFFIX_BY_MOD100[position % 100]}"
+
+
+# All labels for the slider's bounded 1..30 range, precomputed at import
+_POSITION_LABELS = tuple(_position_suffix(p) for p in range(31))
+
+
+def _position_label(position: int) -> str:
+    """Ordinal label via O(1) table lookup, with a computed fallback past 30"""
+    if position < len(_POSITION_LABELS):
+        return _POSITION_LABELS[position]
+    return _position_suffix(position)
+
+
+@lru_cache(maxsize=64)
+def _distribute_cents(weights: tuple[int, ...], total_cents: int) -> tuple[int, ...]:
+    """Split a pool (in cents) across weights so the parts sum exactly.
+
+    Uses integer divmod plus largest-remainder rounding, so there is no
+    floating-point drift and every cent of the pool is paid out. Memoized:
+    repeated recalculations with the same weights and pool (slider jitter,
+    checkbox toggles) hit the cache instead of redoing the division loop.
+    """
+    total_weight = sum(weights)
+    if total_weight <= 0:
+        return (0,) * len(weights)
+
+    shares = []
+    remainders = []
+    for weight in weights:
+        base, rem = divmod(weight * total_cents, total_weight)
+        shares.append(base)
+        remainders.append(rem)
+
+    # Hand the leftover cents to the positions with the largest remainders
+    leftover = total_cents - sum(shares)
+    for i in sorted(range(len(weights)), key=lambda i: remainders[i], reverse=True)[:leftover]:
+        shares[i] += 1
+
+    return tuple(shares)
+
+
+class PlayerRecord:
+    """Per-player bank state - plain attributes with no Tcl-side storage"""
+    __slots__ = ('name', 'buy_in', 'food', 'bounty', 'all', 'eliminated', 'payed_out')
+
+    def __init__(self, name):
+        self.name = name
+        self.buy_in = False
+        self.food = False
+        self.bounty = False
+        self.all = False
+        self.eliminated = False
+        self.payed_out = False
 
 
 class PokerPayoutCalculator:
     def __init__(self):
+        _init_gui()
         self.root = ctk.CTk()
         self.root.title("🃏 Poker Payout Calculator")
         self.root.geometry("1200x1200")
         self.root.resizable(True, True)
-        self.root.configure(fg_color=POKER_COLORS["felt_green"])
+        self.root.configure(fg_color=POKER_COLORS.felt_green)
+
+        # Direct Tcl variable accessor - cheaper than Variable.get()
+        self._getvar = self.root.tk.globalgetvar
         
         # Default payout weights for top 9 positions
         self.default_weights = [35, 20, 15, 10, 8, 6, 3, 2, 1]
@@ -41,22 +153,89 @@ class PokerPayoutCalculator:
         
         # Variables for interactive updates
         self.num_players = tk.IntVar(value=9)
+        self._num_players = 9  # Python-side mirror; Tk variable reads round-trip into Tcl
+        # StringVar behind the slider's count label - drag updates are one
+        # Tcl variable write, skipped when the shown count hasn't moved
+        self._player_count_text = tk.StringVar(value="Players: 9")
+        self._shown_player_count = 9
         self.buy_in = tk.DoubleVar(value=20.0)
         self.food_per_player = tk.DoubleVar(value=5.0)
         self.bounty_per_player = tk.DoubleVar(value=2.0)
+        # Python-side copy of the three rates, refreshed when an entry
+        # changes, so checkbox clicks never re-read the DoubleVars
+        self._pool_inputs = (20.0, 5.0, 2.0)
         
         # Timer variables
         self.game_duration = tk.IntVar(value=180)  # Default 3 hours in minutes
+        # Seconds mirror of the duration entry, refreshed by its trace, so
+        # the per-tick path never round-trips into Tcl for it
+        self._duration_seconds = 180 * 60
         self.current_time = 0  # Current time in seconds
         self.timer_running = False
         self.timer_job = None
         self.timer_direction = tk.StringVar(value="countdown")  # countdown or countup
+        # Monotonic deadline for the next tick - scheduling against it keeps
+        # the timer drift-free even though each callback runs a little late
+        self._next_tick = 0.0
+        # Timer text lives in a StringVar - a set() is one Tcl variable
+        # write, where configure(text=...) re-runs widget option handling
+        self._timer_text = tk.StringVar(value="3:00:00")
+        # Last rendered timer text/color, to skip redundant updates
+        self._last_time_str = None
+        self._last_timer_color = None
+        # Time's-up flash state (after() handle plus transition counter)
+        self._flash_job = None
+        self._flash_count = 0
+        # Progress bar position quantized to its pixel width, so ticks that
+        # can't move the bar a visible amount skip the redraw
+        self._last_progress_pixel = None
         
         # Weights window reference
         self.weights_window = None
-        
-        # Player payment tracking
-        self.player_data = []  # List of dicts with player info and payment status
+
+        # Pending debounced slider update (after() handle)
+        self._pending_player_update = None
+
+        # Pending debounced recalculation from entry traces (after() handle)
+        self._recalc_job = None
+
+        # Suppresses the num_players trace for programmatic set() calls
+        self._suppress_trace = False
+
+        # Last rendered weights summary, to skip redundant label updates
+        self._last_weights_summary = None
+
+        # Last rendered text per label, to skip redundant configure calls
+        self._label_text_cache = {}
+        self._last_percent_state = None
+
+        # Cached summary string, rebuilt only when the weights change
+        self._weights_summary_cache = None
+
+        # Tuple snapshot of the weights, rebuilt only when they change
+        self._weights_tuple = None
+
+        # Shape cache: (num_players, weights) -> paying weights slice, so the
+        # steady-state recalculation skips the position math entirely
+        self._shape_key = None
+        self._paying_weights = ()
+
+        # Full input key of the last rendered calculation; a recalculation
+        # with identical inputs is a no-op
+        self._last_calc_key = None
+
+        # True while a throttled rebuild is already scheduled
+        self._calc_pending = False
+        
+        # Player payment tracking - plain Python bools, no Tcl-side variables
+        self.player_data = []  # List of PlayerRecords with player info and payment status
+        # Running aggregates maintained by the checkbox handlers, so the
+        # pool summary is O(1) instead of walking every player
+        self._flag_counts = {'buy_in': 0, 'food': 0, 'bounty': 0, 'eliminated': 0, 'payed_out': 0}
+        # Pooled bank rows - player count changes reconfigure and show/hide
+        # these instead of destroying and rebuilding checkbox widgets
+        self._bank_rows = []
+        self._bank_header = None
         self.bank_frame = None
         
         self.setup_ui()
@@ -66,6 +245,7 @@ class PokerPayoutCalculator:
         self.buy_in.trace_add("write", self.on_value_change)
         self.food_per_player.trace_add("write", self.on_value_change)
         self.bounty_per_player.trace_add("write", self.on_value_change)
+        self.game_duration.trace_add("write", self._on_duration_change)
         
         # Initial calculation and display updates
         self.update_total_per_player()
@@ -77,8 +257,8 @@ class PokerPayoutCalculator:
         label = ctk.CTkLabel(
             parent,
             text=text,
-            font=ctk.CTkFont(size=size, weight=weight),
-            text_color=POKER_COLORS[color]
+            font=_get_font(size, weight),
+            text_color=getattr(POKER_COLORS, color)
         )
         if pack_kwargs:
             label.pack(**pack_kwargs)
@@ -107,8 +287,8 @@ class PokerPayoutCalculator:
             row_frame,
             textvariable=variable,
             width=width,
-            fg_color=POKER_COLORS["dark_green"],
-            border_color=POKER_COLORS["accent_green"]
+            fg_color=POKER_COLORS.dark_green,
+            border_color=POKER_COLORS.accent_green
         )
         entry.pack(side="right")
         return row_frame
@@ -119,6 +299,30 @@ class PokerPayoutCalculator:
             return variable.get()
         except tk.TclError:
             return default
+
+    def _get_fast(self, variable, default=0.0):
+        """Fetch a Tk variable's float value via the raw Tcl accessor.
+
+        Skips the Variable.get() wrapper (type coercion, extra attribute
+        lookups) on the hot read path; falls back on partial input.
+        """
+        try:
+            return float(self._getvar(variable._name))
+        except (tk.TclError, ValueError, TypeError):
+            return default
+
+    def pool_snapshot(self):
+        """Read all pool inputs from Tk once and share the snapshot.
+
+        Rates come back as None while their entry is mid-edit and doesn't
+        parse; callers keep their last good state in that case.
+        """
+        return (
+            self._num_players,
+            self._get_fast(self.buy_in, None),
+            self._get_fast(self.food_per_player, None),
+            self._get_fast(self.bounty_per_player, None)
+        )
         
     def setup_ui(self):
         """Setup the user interface with left controls, middle results, and right timer/chips"""
@@ -132,15 +336,15 @@ class PokerPayoutCalculator:
         left_frame.pack_propagate(False)
         
         # Controls frame (top part of left side)
-        controls_frame = ctk.CTkFrame(left_frame, fg_color=POKER_COLORS["dark_green"])
+        controls_frame = ctk.CTkFrame(left_frame, fg_color=POKER_COLORS.dark_green)
         controls_frame.pack(fill="x", pady=(0, 10))
         
         # Bank frame (bottom part of left side)
-        self.bank_frame = ctk.CTkFrame(left_frame, fg_color=POKER_COLORS["dark_green"])
+        self.bank_frame = ctk.CTkFrame(left_frame, fg_color=POKER_COLORS.dark_green)
         self.bank_frame.pack(fill="both", expand=True)
         
         # Middle - Tournament Results
-        middle_frame = ctk.CTkFrame(main_container, fg_color=POKER_COLORS["medium_green"], width=400)
+        middle_frame = ctk.CTkFrame(main_container, fg_color=POKER_COLORS.medium_green, width=400)
         middle_frame.pack(side="left", fill="both", expand=True, padx=(0, 10))
         middle_frame.pack_propagate(False)
         
@@ -150,11 +354,11 @@ class PokerPayoutCalculator:
         right_frame.pack_propagate(False)
         
         # Timer frame (top part of right side)
-        timer_frame = ctk.CTkFrame(right_frame, fg_color=POKER_COLORS["dark_green"])
+        timer_frame = ctk.CTkFrame(right_frame, fg_color=POKER_COLORS.dark_green)
         timer_frame.pack(fill="x", pady=(0, 10))
         
         # Blinds frame (bottom part of right side)
-        blinds_frame = ctk.CTkFrame(right_frame, fg_color=POKER_COLORS["dark_green"])
+        blinds_frame = ctk.CTkFrame(right_frame, fg_color=POKER_COLORS.dark_green)
         blinds_frame.pack(fill="both", expand=True)
         
         # Setup all sections
@@ -194,22 +398,69 @@ class PokerPayoutCalculator:
         # Scrollable frame for results
         self.results_scroll = ctk.CTkScrollableFrame(
             parent,
-            fg_color=POKER_COLORS["felt_green"],
-            scrollbar_fg_color=POKER_COLORS["dark_green"]
+            fg_color=POKER_COLORS.felt_green,
+            scrollbar_fg_color=POKER_COLORS.dark_green
         )
         self.results_scroll.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+
+        # Build the result sections once; recalculations only reconfigure
+        # labels and show/hide rows instead of destroying widgets
+        self.setup_pool_summary()
+        self._rows_container = ctk.CTkFrame(self.results_scroll, fg_color="transparent")
+        self._rows_container.pack(fill="x")
+        self._payout_rows = []
+        self._visible_payout_rows = 0
+        self.setup_bounty_info()
+
+        # Shared error label, shown only when a calculation fails
+        self._error_label = ctk.CTkLabel(
+            self.results_scroll,
+            text="",
+            font=_get_font(12),
+            text_color="red"
+        )
+
+    def setup_pool_summary(self):
+        """Build the pool summary section once; values update in place"""
+        self._summary_frame = ctk.CTkFrame(self.results_scroll, fg_color=POKER_COLORS.dark_green)
+        self._summary_frame.pack(fill="x", pady=(0, 15), padx=10)
+
+        self.create_label(self._summary_frame, "💰 Pool Summary", size=16, weight="bold",
+                          color="gold", pady=(10, 5))
+
+        # One multi-line label for the prize/food/bounty breakdown - a
+        # single widget for the geometry manager, and the optional pools
+        # become text lines instead of pack/pack_forget churn
+        self._pools_label = self.create_label(self._summary_frame, "")
+        self._pools_label.pack()
+
+        self._total_pool_summary_label = self.create_label(
+            self._summary_frame, "", size=14, weight="bold", color="gold", pady=(5, 10))
+
+    def setup_bounty_info(self):
+        """Build the bounty info section once; shown only when bounties are on"""
+        self._bounty_frame = ctk.CTkFrame(self.results_scroll, fg_color=POKER_COLORS.medium_green)
+
+        self.create_label(self._bounty_frame, "🎯 Bounty Information", size=16, weight="bold",
+                          color="gold", pady=(10, 5))
+
+        self._bounty_per_ko_label = self.create_label(self._bounty_frame, "")
+        self._bounty_per_ko_label.pack()
+
+        self._bounty_total_label = self.create_label(self._bounty_frame, "", pady=(0, 10))
+        self._bounty_frame_visible = False
         
     def create_player_section(self, parent):
         """Create the player count section"""
-        player_frame = ctk.CTkFrame(parent, fg_color=POKER_COLORS["light_green"])
+        player_frame = ctk.CTkFrame(parent, fg_color=POKER_COLORS.light_green)
         player_frame.pack(fill="x", pady=(0, 15), padx=20)
         
         # Player count label
         player_label = ctk.CTkLabel(
             player_frame, 
             text="Number of Players:", 
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=POKER_COLORS["card_white"]
+            font=_get_font(16, "bold"),
+            text_color=POKER_COLORS.card_white
         )
         player_label.pack(pady=(15, 5))
         
@@ -219,10 +470,10 @@ class PokerPayoutCalculator:
             from_=3,
             to=30,
             number_of_steps=27,
-            fg_color=POKER_COLORS["dark_green"],
-            progress_color=POKER_COLORS["accent_green"],
-            button_color=POKER_COLORS["gold"],
-            button_hover_color=POKER_COLORS["gold"]
+            fg_color=POKER_COLORS.dark_green,
+            progress_color=POKER_COLORS.accent_green,
+            button_color=POKER_COLORS.gold,
+            button_hover_color=POKER_COLORS.gold
         )
         self.player_slider.set(self.num_players.get())  # Set initial value manually
         self.player_slider.pack(pady=5, padx=20, fill="x")
@@ -234,15 +485,15 @@ class PokerPayoutCalculator:
         # Player count display
         self.player_count_label = ctk.CTkLabel(
             player_frame,
-            text=f"Players: {self.num_players.get()}",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=POKER_COLORS["gold"]
+            textvariable=self._player_count_text,
+            font=_get_font(14, "bold"),
+            text_color=POKER_COLORS.gold
         )
         self.player_count_label.pack(pady=(5, 15))
         
     def create_pool_section(self, parent):
         """Create the pool configuration section"""
-        pool_frame = ctk.CTkFrame(parent, fg_color=POKER_COLORS["light_green"])
+        pool_frame = ctk.CTkFrame(parent, fg_color=POKER_COLORS.light_green)
         pool_frame.pack(fill="x", pady=(0, 15), padx=20)
         
         self.create_title_label(pool_frame, "Pool Configuration", "💵", size=16, pady=(15, 10))
@@ -253,7 +504,7 @@ class PokerPayoutCalculator:
         self.create_entry_row(pool_frame, "Bounty per player ($):", self.bounty_per_player)
         
         # Total per player display
-        total_frame = ctk.CTkFrame(pool_frame, fg_color=POKER_COLORS["dark_green"], corner_radius=8)
+        total_frame = ctk.CTkFrame(pool_frame, fg_color=POKER_COLORS.dark_green, corner_radius=8)
         total_frame.pack(fill="x", padx=20, pady=(10, 15))
         
         self.create_label(
@@ -274,7 +525,7 @@ class PokerPayoutCalculator:
         
     def create_weights_section(self, parent):
         """Create the payout weights configuration section"""
-        weights_frame = ctk.CTkFrame(parent, fg_color=POKER_COLORS["light_green"])
+        weights_frame = ctk.CTkFrame(parent, fg_color=POKER_COLORS.light_green)
         weights_frame.pack(fill="x", pady=(0, 15), padx=20)
         
         self.create_title_label(weights_frame, "Payout Weights", "⚖️", size=16, pady=(15, 10))
@@ -296,9 +547,9 @@ class PokerPayoutCalculator:
             weights_btn_frame,
             text="🔧 Customize Weights",
             command=self.open_weights_window,
-            fg_color=POKER_COLORS["accent_green"],
-            hover_color=POKER_COLORS["medium_green"],
-            text_color=POKER_COLORS["card_white"]
+            fg_color=POKER_COLORS.accent_green,
+            hover_color=POKER_COLORS.medium_green,
+            text_color=POKER_COLORS.card_white
         )
         edit_weights_btn.pack(side="left", padx=5)
         
@@ -306,9 +557,9 @@ class PokerPayoutCalculator:
             weights_btn_frame,
             text="🔄 Reset",
             command=self.reset_weights,
-            fg_color=POKER_COLORS["dark_green"],
-            hover_color=POKER_COLORS["medium_green"],
-            text_color=POKER_COLORS["card_white"]
+            fg_color=POKER_COLORS.dark_green,
+            hover_color=POKER_COLORS.medium_green,
+            text_color=POKER_COLORS.card_white
         )
         reset_weights_btn.pack(side="left", padx=5)
         
@@ -323,38 +574,44 @@ class PokerPayoutCalculator:
         )
         
         # Pool summary section
-        pool_summary_frame = ctk.CTkFrame(parent, fg_color=POKER_COLORS["light_green"])
+        pool_summary_frame = ctk.CTkFrame(parent, fg_color=POKER_COLORS.light_green)
         pool_summary_frame.pack(fill="x", padx=20, pady=(0, 10))
         
+        # StringVar-backed labels: a summary refresh is then a Tcl variable
+        # write instead of a configure pass through the widget options
+        self.total_pool_var = tk.StringVar(value="Total Pool: $0.00")
+        self.total_paid_var = tk.StringVar(value="Total Paid: $0.00")
+        self.percent_paid_var = tk.StringVar(value="Percent Paid: 0%")
+
         self.total_pool_label = ctk.CTkLabel(
             pool_summary_frame,
-            text="Total Pool: $0.00",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=POKER_COLORS["card_white"]
+            textvariable=self.total_pool_var,
+            font=_get_font(14, "bold"),
+            text_color=POKER_COLORS.card_white
         )
         self.total_pool_label.pack(pady=5)
-        
+
         self.total_paid_label = ctk.CTkLabel(
             pool_summary_frame,
-            text="Total Paid: $0.00",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=POKER_COLORS["card_white"]
+            textvariable=self.total_paid_var,
+            font=_get_font(14, "bold"),
+            text_color=POKER_COLORS.card_white
         )
         self.total_paid_label.pack(pady=5)
-        
+
         self.percent_paid_label = ctk.CTkLabel(
             pool_summary_frame,
-            text="Percent Paid: 0%",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=POKER_COLORS["gold"]
+            textvariable=self.percent_paid_var,
+            font=_get_font(14, "bold"),
+            text_color=POKER_COLORS.gold
         )
         self.percent_paid_label.pack(pady=(5, 10))
         
         # Scrollable frame for player rows
         self.bank_scroll = ctk.CTkScrollableFrame(
             parent,
-            fg_color=POKER_COLORS["medium_green"],
-            scrollbar_fg_color=POKER_COLORS["dark_green"]
+            fg_color=POKER_COLORS.medium_green,
+            scrollbar_fg_color=POKER_COLORS.dark_green
         )
         self.bank_scroll.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
@@ -363,317 +620,335 @@ class PokerPayoutCalculator:
         
     def update_player_data(self):
         """Update player data list when player count changes"""
-        num_players = self.num_players.get()
+        num_players = self._num_players
         
         # Adjust player data list to match current player count
         while len(self.player_data) < num_players:
-            self.player_data.append({
-                'name': f"Player {len(self.player_data) + 1}",
-                'buy_in': tk.BooleanVar(value=False),
-                'food': tk.BooleanVar(value=False),
-                'bounty': tk.BooleanVar(value=False),
-                'all': tk.BooleanVar(value=False),
-                'eliminated': tk.BooleanVar(value=False),
-                'payed_out': tk.BooleanVar(value=False)
-            })
-        
-        # Remove excess players
-        while len(self.player_data) > num_players:
-            self.player_data.pop()
+            self.player_data.append(PlayerRecord(f"Player {len(self.player_data) + 1}"))
+        
+        # Remove excess players in one slice delete, dropping their flags
+        # from the aggregates first
+        if len(self.player_data) > num_players:
+            for dropped in self.player_data[num_players:]:
+                for field in self._flag_counts:
+                    if getattr(dropped, field):
+                        self._flag_counts[field] -= 1
+            del self.player_data[num_players:]
         
         # Update the bank display
         self.update_bank_display()
         
     def update_bank_display(self):
         """Update the bank display with current player data"""
-        # Clear existing player rows
-        for widget in self.bank_scroll.winfo_children():
-            widget.destroy()
-        
-        # Create header row with labels
-        header_frame = ctk.CTkFrame(self.bank_scroll, fg_color=POKER_COLORS["medium_green"])
+        # Unmap the scroll frame for the sync so the geometry manager lays
+        # out the row changes in a single pass at the end instead of
+        # re-laying out after every pack call
+        self.bank_scroll.pack_forget()
+        try:
+            self._sync_bank_rows()
+        finally:
+            self.bank_scroll.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+            self.root.update_idletasks()
+
+    def _sync_bank_rows(self):
+        """Sync the pooled header and player rows to the current roster"""
+        if self._bank_header is None:
+            self._build_bank_header()
+
+        # Reuse pooled rows in place - a CTkCheckBox is hundreds of Tk
+        # objects, so a slider drag must never reconstruct six per player
+        for i, player in enumerate(self.player_data):
+            if i >= len(self._bank_rows):
+                self._add_bank_row(i)
+            row = self._bank_rows[i]
+            row['name_var'].set(player.name)
+            for field, check in row['checks'].items():
+                self._sync_checkbox(check, getattr(player, field))
+            if not row['visible']:
+                row['frame'].pack(fill="x", pady=1, padx=5)
+                row['visible'] = True
+
+        # Hide pooled rows past the current player count
+        for row in self._bank_rows[len(self.player_data):]:
+            if row['visible']:
+                row['frame'].pack_forget()
+                row['visible'] = False
+
+        # Update pool summary
+        self.update_pool_summary()
+
+    def _build_bank_header(self):
+        """Create the header row once; it never changes afterwards"""
+        header_frame = ctk.CTkFrame(self.bank_scroll, fg_color=POKER_COLORS.medium_green)
         header_frame.pack(fill="x", pady=(0, 5), padx=5)
-        
+        self._bank_header = header_frame
+
         # Player name label
         ctk.CTkLabel(
             header_frame,
             text="Player Name",
-            font=ctk.CTkFont(size=11, weight="bold"),
-            text_color=POKER_COLORS["card_white"],
+            font=_get_font(11, "bold"),
+            text_color=POKER_COLORS.card_white,
             width=120
         ).pack(side="left", padx=(5, 10), pady=5)
         
-        # Labels frame for checkboxes
-        labels_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
-        labels_frame.pack(side="right", padx=5, pady=5)
-        
-        # Checkbox labels
+        # Checkbox labels - packed right-to-left directly into the header,
+        # avoiding a nested transparent frame per geometry pass
         labels = [
-            ("Buy-In", POKER_COLORS["card_white"]),
-            ("Food", POKER_COLORS["card_white"]),
-            ("Bounty", POKER_COLORS["card_white"]),
-            ("All", POKER_COLORS["gold"]),
+            ("Buy-In", POKER_COLORS.card_white),
+            ("Food", POKER_COLORS.card_white),
+            ("Bounty", POKER_COLORS.card_white),
+            ("All", POKER_COLORS.gold),
             ("❌", "#DC143C"),  # Red X for eliminated
             ("⭐", "#FFD700")   # Gold star for payed out
         ]
-        
-        for label_text, color in labels:
+
+        for label_text, color in reversed(labels):
             ctk.CTkLabel(
-                labels_frame,
+                header_frame,
                 text=label_text,
-                font=ctk.CTkFont(size=9, weight="bold"),
+                font=_get_font(9, "bold"),
                 text_color=color,
                 width=36
-            ).pack(side="left", padx=0)
-        
-        # Create player rows
-        for i, player in enumerate(self.player_data):
-            self.create_player_row(i, player)
-        
-        # Update pool summary
-        self.update_pool_summary()
-        
-    def create_player_row(self, index, player):
-        """Create a row for a player with name entry and checkboxes"""
-        player_frame = ctk.CTkFrame(self.bank_scroll, fg_color=POKER_COLORS["dark_green"])
-        player_frame.pack(fill="x", pady=1, padx=5)
-        
-        # Player name entry
-        name_var = tk.StringVar(value=player['name'])
-        name_var.trace_add("write", lambda *args: self.on_player_name_change(index, name_var.get()))
-        
+            ).pack(side="right", padx=0, pady=5)
+
+    def _add_bank_row(self, index):
+        """Create one pooled bank row (hidden until packed)"""
+        player_frame = ctk.CTkFrame(self.bank_scroll, fg_color=POKER_COLORS.dark_green)
+
+        # Player name entry - committed when editing ends, not per keystroke
+        name_var = tk.StringVar()
+
         name_entry = ctk.CTkEntry(
             player_frame,
             textvariable=name_var,
             width=120,
             height=28,
-            fg_color=POKER_COLORS["felt_green"],
-            border_color=POKER_COLORS["accent_green"]
+            fg_color=POKER_COLORS.felt_green,
+            border_color=POKER_COLORS.accent_green
         )
         name_entry.pack(side="left", padx=(5, 10), pady=3)
-        
-        # Checkboxes frame
-        checks_frame = ctk.CTkFrame(player_frame, fg_color="transparent")
-        checks_frame.pack(side="right", padx=5, pady=3)
-        
-        # Buy-in checkbox
-        buy_in_check = ctk.CTkCheckBox(
-            checks_frame,
-            text="",
-            variable=player['buy_in'],
-            command=lambda: self.on_checkbox_change(index),
-            width=20,
-            height=20,
-            checkbox_width=18,
-            checkbox_height=18,
-            fg_color=POKER_COLORS["accent_green"],
-            hover_color=POKER_COLORS["medium_green"],
-            checkmark_color=POKER_COLORS["dark_green"]
-        )
-        buy_in_check.pack(side="left", padx=8)
-        
-        # Food checkbox
-        food_check = ctk.CTkCheckBox(
-            checks_frame,
-            text="",
-            variable=player['food'],
-            command=lambda: self.on_checkbox_change(index),
-            width=20,
-            height=20,
-            checkbox_width=18,
-            checkbox_height=18,
-            fg_color=POKER_COLORS["accent_green"],
-            hover_color=POKER_COLORS["medium_green"],
-            checkmark_color=POKER_COLORS["dark_green"]
-        )
-        food_check.pack(side="left", padx=8)
-        
-        # Bounty checkbox
-        bounty_check = ctk.CTkCheckBox(
-            checks_frame,
-            text="",
-            variable=player['bounty'],
-            command=lambda: self.on_checkbox_change(index),
-            width=20,
-            height=20,
-            checkbox_width=18,
-            checkbox_height=18,
-            fg_color=POKER_COLORS["accent_green"],
-            hover_color=POKER_COLORS["medium_green"],
-            checkmark_color=POKER_COLORS["dark_green"]
-        )
-        bounty_check.pack(side="left", padx=8)
-        
-        # All checkbox
-        all_check = ctk.CTkCheckBox(
-            checks_frame,
-            text="",
-            variable=player['all'],
-            command=lambda: self.on_all_checkbox_change(index),
-            width=20,
-            height=20,
-            checkbox_width=18,
-            checkbox_height=18,
-            fg_color=POKER_COLORS["gold"],
-            hover_color=POKER_COLORS["accent_green"],
-            checkmark_color=POKER_COLORS["dark_green"]
-        )
-        all_check.pack(side="left", padx=8)
-        
-        # Eliminated checkbox (red X when checked)
-        eliminated_check = ctk.CTkCheckBox(
-            checks_frame,
-            text="",
-            variable=player['eliminated'],
-            command=lambda: self.update_pool_summary(),
-            width=20,
-            height=20,
-            checkbox_width=18,
-            checkbox_height=18,
-            fg_color="#DC143C",  # Crimson red
-            hover_color="#B22222",  # Dark red
-            checkmark_color=POKER_COLORS["dark_green"]
-        )
-        eliminated_check.pack(side="left", padx=8)
-        
-        # Payed out checkbox (gold star effect)
-        payed_out_check = ctk.CTkCheckBox(
-            checks_frame,
-            text="",
-            variable=player['payed_out'],
-            command=lambda: self.update_pool_summary(),
-            width=20,
-            height=20,
-            checkbox_width=18,
-            checkbox_height=18,
-            fg_color="#FFD700",  # Gold
-            hover_color="#FFA500",  # Orange
-            checkmark_color=POKER_COLORS["dark_green"]
-        )
-        payed_out_check.pack(side="left", padx=8)
-        
+        name_entry.bind("<FocusOut>", lambda e, i=index, v=name_var: self.on_player_name_change(i, v.get()))
+        name_entry.bind("<Return>", lambda e, i=index, v=name_var: self.on_player_name_change(i, v.get()))
+        
+        # (field, command, fg color, hover color) for each checkbox column -
+        # partial() binds the index without allocating a closure per checkbox
+        checkbox_specs = [
+            ('buy_in', partial(self.on_checkbox_change, index, 'buy_in'),
+             POKER_COLORS.accent_green, POKER_COLORS.medium_green),
+            ('food', partial(self.on_checkbox_change, index, 'food'),
+             POKER_COLORS.accent_green, POKER_COLORS.medium_green),
+            ('bounty', partial(self.on_checkbox_change, index, 'bounty'),
+             POKER_COLORS.accent_green, POKER_COLORS.medium_green),
+            ('all', partial(self.on_all_checkbox_change, index),
+             POKER_COLORS.gold, POKER_COLORS.accent_green),
+            ('eliminated', partial(self.on_status_checkbox_change, index, 'eliminated'),
+             "#DC143C", "#B22222"),  # Crimson red / dark red
+            ('payed_out', partial(self.on_status_checkbox_change, index, 'payed_out'),
+             "#FFD700", "#FFA500")   # Gold / orange
+        ]
+
+        # Checkboxes pack right-to-left straight into the row frame - no
+        # nested transparent wrapper for the geometry manager to relayout
+        checks = {}
+        for field, command, fg_color, hover_color in reversed(checkbox_specs):
+            check = ctk.CTkCheckBox(
+                player_frame,
+                text="",
+                command=command,
+                width=20,
+                height=20,
+                checkbox_width=18,
+                checkbox_height=18,
+                fg_color=fg_color,
+                hover_color=hover_color,
+                checkmark_color=POKER_COLORS.dark_green
+            )
+            check.pack(side="right", padx=8, pady=3)
+            checks[field] = check
+
+        self._bank_rows.append({
+            'frame': player_frame,
+            'name_var': name_var,
+            'checks': checks,
+            'visible': False
+        })
+
+    def _sync_checkbox(self, check, checked):
+        """Make a checkbox widget reflect a plain-bool state without firing its command"""
+        if checked:
+            check.select()
+        else:
+            check.deselect()
+
     def on_player_name_change(self, index, new_name):
         """Handle player name change"""
         if index < len(self.player_data):
-            self.player_data[index]['name'] = new_name
-        
-    def on_checkbox_change(self, index):
-        """Handle individual checkbox changes"""
+            self.player_data[index].name = new_name
+
+    def on_checkbox_change(self, index, field):
+        """Handle individual payment checkbox changes"""
         if index < len(self.player_data):
             player = self.player_data[index]
+            checked = not getattr(player, field)
+            setattr(player, field, checked)
+            self._flag_counts[field] += 1 if checked else -1
             # Check if all individual checkboxes are checked
-            all_checked = (player['buy_in'].get() and 
-                          player['food'].get() and 
-                          player['bounty'].get())
-            player['all'].set(all_checked)
+            all_checked = player.buy_in and player.food and player.bounty
+            if all_checked != player.all:
+                player.all = all_checked
+                self._sync_checkbox(self._bank_rows[index]['checks']['all'], all_checked)
             self.update_pool_summary()
-        
+
     def on_all_checkbox_change(self, index):
         """Handle 'All' checkbox change - only affects payment checkboxes"""
         if index < len(self.player_data):
             player = self.player_data[index]
-            all_checked = player['all'].get()
-            player['buy_in'].set(all_checked)
-            player['food'].set(all_checked)
-            player['bounty'].set(all_checked)
+            all_checked = not player.all
+            player.all = all_checked
+            checks = self._bank_rows[index]['checks']
+            for field in ('buy_in', 'food', 'bounty'):
+                if getattr(player, field) != all_checked:
+                    setattr(player, field, all_checked)
+                    self._flag_counts[field] += 1 if all_checked else -1
+                    self._sync_checkbox(checks[field], all_checked)
+            self.update_pool_summary()
+
+    def on_status_checkbox_change(self, index, field):
+        """Handle eliminated/payed-out checkbox changes"""
+        if index < len(self.player_data):
+            player = self.player_data[index]
+            checked = not getattr(player, field)
+            setattr(player, field, checked)
+            self._flag_counts[field] += 1 if checked else -1
             self.update_pool_summary()
         
     def update_pool_summary(self):
         """Update the pool summary display"""
         try:
-            # Calculate totals using safe value retrieval
-            num_players = self.num_players.get()
-            buy_in = self.safe_get_value(self.buy_in)
-            food_per_player = self.safe_get_value(self.food_per_player)
-            bounty_per_player = self.safe_get_value(self.bounty_per_player)
-            
+            # Totals use the cached rates - entry traces keep them fresh, so
+            # checkbox clicks skip the Tcl variable reads entirely
+            num_players = self._num_players
+            buy_in, food_per_player, bounty_per_player = self._pool_inputs
+
             total_pool = num_players * (buy_in + food_per_player + bounty_per_player)
             
-            # Calculate total paid and player statistics
-            total_paid = 0
-            eliminated_count = 0
-            payed_out_count = 0
-            
-            for player in self.player_data:
-                if player['buy_in'].get():
-                    total_paid += buy_in
-                if player['food'].get():
-                    total_paid += food_per_player
-                if player['bounty'].get():
-                    total_paid += bounty_per_player
-                if player['eliminated'].get():
-                    eliminated_count += 1
-                if player['payed_out'].get():
-                    payed_out_count += 1
+            # Totals come straight from the running flag counts - O(1)
+            counts = self._flag_counts
+            total_paid = (counts['buy_in'] * buy_in +
+                          counts['food'] * food_per_player +
+                          counts['bounty'] * bounty_per_player)
+            eliminated_count = counts['eliminated']
+            payed_out_count = counts['payed_out']
             
             # Calculate percentage
             percent_paid = (total_paid / total_pool * 100) if total_pool > 0 else 0
             
             # Update labels
-            self.total_pool_label.configure(text=f"Total Pool: ${total_pool:.2f}")
-            self.total_paid_label.configure(text=f"Total Paid: ${total_paid:.2f}")
-            
+            self._set_var_text(self.total_pool_var, f"Total Pool: ${total_pool:.2f}")
+            self._set_var_text(self.total_paid_var, f"Total Paid: ${total_paid:.2f}")
+
             # Color code the percentage based on completion
             if percent_paid >= 100:
-                color = POKER_COLORS["accent_green"]
+                color = POKER_COLORS.accent_green
             elif percent_paid >= 75:
-                color = POKER_COLORS["gold"]
+                color = POKER_COLORS.gold
             else:
-                color = POKER_COLORS["card_white"]
-                
+                color = POKER_COLORS.card_white
+
             # Update percent label with additional stats
             remaining_players = num_players - eliminated_count
             percent_text = f"Paid: {percent_paid:.1f}% | Active: {remaining_players} | Paid Out: {payed_out_count}"
-            
-            self.percent_paid_label.configure(
-                text=percent_text,
-                text_color=color
-            )
+
+            if (percent_text, color) != self._last_percent_state:
+                self._last_percent_state = (percent_text, color)
+                self._set_var_text(self.percent_paid_var, percent_text)
+                self.percent_paid_label.configure(text_color=color)
         except Exception as e:
             # Handle any errors gracefully
-            if hasattr(self, 'total_pool_label'):
-                self.total_pool_label.configure(text="Total Pool: $0.00")
-            if hasattr(self, 'total_paid_label'):
-                self.total_paid_label.configure(text="Total Paid: $0.00")
-            if hasattr(self, 'percent_paid_label'):
-                self.percent_paid_label.configure(text="Paid: 0% | Active: 0 | Paid Out: 0")
+            if hasattr(self, 'total_pool_var'):
+                self._set_var_text(self.total_pool_var, "Total Pool: $0.00")
+            if hasattr(self, 'total_paid_var'):
+                self._set_var_text(self.total_paid_var, "Total Paid: $0.00")
+            if hasattr(self, 'percent_paid_var'):
+                self._last_percent_state = None
+                self._set_var_text(self.percent_paid_var, "Paid: 0% | Active: 0 | Paid Out: 0")
         
     def get_position_suffix(self, position: int) -> str:
         """Get the appropriate suffix for position numbers"""
-        if 10 <= position % 100 <= 20:
-            suffix = "th"
-        else:
-            suffix = {1: "st", 2: "nd", 3: "rd"}.get(position % 10, "th")
-        return f"{position}{suffix}"
-    
+        return _position_label(position)
+
+    def _show_player_count(self, count):
+        """Refresh the slider's count label, once per distinct value"""
+        if count != self._shown_player_count:
+            self._shown_player_count = count
+            self._player_count_text.set(f"Players: {count}")
+
     def on_player_change(self, value):
-        """Handle player count slider change - optimized for final value only"""
+        """Handle player count slider change - no-op when the count is unchanged"""
         player_count = int(value)
-        self.player_count_label.configure(text=f"Players: {player_count}")
-        # Update the variable without triggering trace callbacks
-        self.num_players.set(player_count)
+        if player_count == self._num_players:
+            return
+        self._num_players = player_count
+        self._show_player_count(player_count)
         self.update_player_data()  # Update bank data when player count changes
+        # update_player_data already refreshed the pool summary, so suppress
+        # the trace and run only the payout recalculation ourselves
+        self._suppress_trace = True
+        try:
+            self.num_players.set(player_count)
+        finally:
+            self._suppress_trace = False
         self.calculate_payouts()
     
     def on_player_slider_drag(self, event):
-        """Handle slider drag - only update display label for performance"""
+        """Handle slider drag - update label now, debounce the full update"""
         try:
             current_value = self.player_slider.get()
             player_count = int(current_value)
-            self.player_count_label.configure(text=f"Players: {player_count}")
+            self._show_player_count(player_count)
+            # Coalesce the expensive recalculation until the drag pauses
+            if self._pending_player_update:
+                self.root.after_cancel(self._pending_player_update)
+            self._pending_player_update = self.root.after(60, self._apply_player_change)
         except:
             pass
-    
+
+    def _apply_player_change(self):
+        """Run the debounced full update for the current slider value"""
+        self._pending_player_update = None
+        self.on_player_change(self.player_slider.get())
+
     def on_player_slider_release(self, event):
-        """Handle slider release - perform full update"""
+        """Handle slider release - perform full update immediately"""
         try:
+            if self._pending_player_update:
+                self.root.after_cancel(self._pending_player_update)
+                self._pending_player_update = None
             current_value = self.player_slider.get()
             self.on_player_change(current_value)
         except:
             pass
     
     def on_value_change(self, *args):
-        """Handle any value change that requires recalculation"""
+        """Coalesce trace-driven changes into one deferred recalculation"""
+        if self._suppress_trace:
+            return
+        # Typing "12.50" fires this once per character; rebuild results only
+        # after the input settles instead of five times
+        if self._recalc_job is not None:
+            self.root.after_cancel(self._recalc_job)
+        self._recalc_job = self.root.after(50, self._do_recalc)
+
+    def _do_recalc(self):
+        """Run the full recalculation for the settled input values"""
+        self._recalc_job = None
+        # Refresh the cached rates once; the checkbox path reuses them.
+        # A mid-edit entry (empty or half-typed number) doesn't parse -
+        # keep the last good rates rather than caching zeros
+        snapshot = self.pool_snapshot()[1:]
+        if None not in snapshot:
+            self._pool_inputs = snapshot
         self.calculate_payouts()
         # Update bank summary if bank exists
         if hasattr(self, 'total_pool_label'):
@@ -683,193 +958,209 @@ class PokerPayoutCalculator:
             self.update_total_per_player()
     
     def get_weights_summary(self):
-        """Get a summary string of current weights"""
+        """Get a summary string of current weights (cached until weights change)"""
+        if self._weights_summary_cache is not None:
+            return self._weights_summary_cache
+
         if not self.current_weights:
-            return "No weights set"
-        
-        # Show first few weights
-        summary_weights = self.current_weights[:5]
-        summary = f"Weights: {', '.join(map(str, summary_weights))}"
-        if len(self.current_weights) > 5:
-            summary += f"... (+{len(self.current_weights) - 5} more)"
+            summary = "No weights set"
+        else:
+            # Show first few weights, built in a single pass with no interim strings
+            shown = ', '.join(map(str, self.current_weights[:5]))
+            extra = len(self.current_weights) - 5
+            if extra > 0:
+                summary = f"Weights: {shown}... (+{extra} more)"
+            else:
+                summary = f"Weights: {shown}"
+
+        self._weights_summary_cache = summary
         return summary
     
     def update_total_per_player(self):
         """Update the total amount due per player display"""
         try:
-            # Get current values using safe retrieval
-            buy_in = self.safe_get_value(self.buy_in)
-            food_per_player = self.safe_get_value(self.food_per_player)
-            bounty_per_player = self.safe_get_value(self.bounty_per_player)
-            
+            # Get current values from a single input snapshot
+            _, buy_in, food_per_player, bounty_per_player = self.pool_snapshot()
+            if None in (buy_in, food_per_player, bounty_per_player):
+                return  # Mid-edit entry; keep the last good total
+
             total_per_player = buy_in + food_per_player + bounty_per_player
             
             if hasattr(self, 'total_per_player_label'):
-                self.total_per_player_label.configure(text=f"${total_per_player:.2f}")
+                self._configure_text(self.total_per_player_label, f"${total_per_player:.2f}")
         except (ValueError, AttributeError):
             if hasattr(self, 'total_per_player_label'):
                 self.total_per_player_label.configure(text="$0.00")
     
+    def weights_key(self) -> tuple:
+        """Hashable snapshot of the current weights, cached until they change"""
+        if self._weights_tuple is None:
+            self._weights_tuple = tuple(self.current_weights)
+        return self._weights_tuple
+
+    def calculate_payout_positions(self, num_players: int) -> int:
+        """Number of paying positions: a third of the field, capped by the weights"""
+        # Pure integer arithmetic - no float divide or math module dispatch
+        return min(max(1, num_players // 3), len(self.current_weights))
+
     def calculate_payouts(self):
+        """Request a payout rebuild, throttled to at most ~10 per second"""
+        # However many traces, callbacks, or slider events fire in a burst,
+        # at most one rebuild runs per 100 ms window
+        if self._calc_pending:
+            return
+        self._calc_pending = True
+        self.root.after(100, self._run_calculation)
+
+    def _run_calculation(self):
         """Calculate and display tournament payouts"""
+        self._calc_pending = False
         try:
-            # Clear existing results
-            for widget in self.results_scroll.winfo_children():
-                widget.destroy()
-            
-            # Get current values using safe retrieval
-            num_players = self.num_players.get()
-            buy_in = self.safe_get_value(self.buy_in)
-            food_per_player = self.safe_get_value(self.food_per_player)
-            bounty_per_player = self.safe_get_value(self.bounty_per_player)
-            
+            self._error_label.pack_forget()
+
+            # Get current values from a single input snapshot
+            num_players, buy_in, food_per_player, bounty_per_player = self.pool_snapshot()
+
+            # A mid-edit entry doesn't parse; keep the last good payouts on
+            # screen instead of rebuilding them around a zeroed rate
+            if None in (buy_in, food_per_player, bounty_per_player):
+                return
+
+            # Nothing to redo when every input matches the last render -
+            # redundant triggers (trace echoes, slider release after drag)
+            # land here and bail before any pool math or widget work
+            calc_key = (num_players, buy_in, food_per_player, bounty_per_player, self.weights_key())
+            if calc_key == self._last_calc_key:
+                return
+
             # Calculate pools
             prize_pool = num_players * buy_in
             food_pool = num_players * food_per_player
             bounty_pool = num_players * bounty_per_player
             total_pool = prize_pool + food_pool + bounty_pool
             
-            # Calculate number of paying positions (max 1/3 of players or length of weights)
-            max_paying_positions = min(max(1, num_players // 3), len(self.current_weights))
-            
-            # Calculate total weight
-            paying_weights = self.current_weights[:max_paying_positions]
-            total_weight = sum(paying_weights)
-            
-            if total_weight == 0:
-                total_weight = 1  # Prevent division by zero
-            
+            # Resolve the paying positions only when the tournament shape
+            # (player count or weights) actually changed
+            shape_key = (num_players, self.weights_key())
+            if shape_key != self._shape_key:
+                self._shape_key = shape_key
+                max_paying_positions = self.calculate_payout_positions(num_players)
+                self._paying_weights = shape_key[1][:max_paying_positions]
+
+            paying_weights = self._paying_weights
+            max_paying_positions = len(paying_weights)
+
             # Display pool summary
             self.display_pool_summary(prize_pool, food_pool, bounty_pool, total_pool)
-            
-            # Calculate and display payouts
-            for position in range(max_paying_positions):
-                weight = paying_weights[position]
-                payout = (weight / total_weight) * prize_pool
-                
-                # Create payout display
-                self.create_payout_row(position + 1, payout, weight)
-            
-            # Display bounty information if applicable
-            if bounty_per_player > 0:
-                self.display_bounty_info(bounty_per_player, bounty_pool)
-                
+
+            # Split the prize pool in integer cents so the payouts always
+            # sum to exactly the pool with no floating-point drift
+            prize_pool_cents = int(round(prize_pool * 100))
+            payout_cents = _distribute_cents(paying_weights, prize_pool_cents)
+
+            # When rows appear or disappear, unmap the scroll frame so the
+            # geometry manager lays the batch out in one pass at the remap,
+            # as the bank rebuild does; value-only updates skip the remap
+            rows_changing = max_paying_positions != self._visible_payout_rows
+            if rows_changing:
+                self.results_scroll.pack_forget()
+            try:
+                # Display payouts, then hide any pooled rows past the paying positions
+                for position, (weight, cents) in enumerate(zip(paying_weights, payout_cents), start=1):
+                    self.create_payout_row(position, cents / 100, weight)
+
+                for row in self._payout_rows[max_paying_positions:]:
+                    if row['visible']:
+                        row['frame'].pack_forget()
+                        row['visible'] = False
+
+                # Display bounty information if applicable
+                if bounty_per_player > 0:
+                    self.display_bounty_info(bounty_per_player, bounty_pool)
+                elif self._bounty_frame_visible:
+                    self._bounty_frame.pack_forget()
+                    self._bounty_frame_visible = False
+            finally:
+                if rows_changing:
+                    self.results_scroll.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+                self._visible_payout_rows = max_paying_positions
+
+            self._last_calc_key = calc_key
+
         except Exception as e:
-            # Display error message
-            error_label = ctk.CTkLabel(
-                self.results_scroll,
-                text=f"Error calculating payouts: {str(e)}",
-                font=ctk.CTkFont(size=12),
-                text_color="red"
-            )
-            error_label.pack(pady=10)
+            # Display error message, and drop the key so the next trigger retries
+            self._last_calc_key = None
+            self._error_label.configure(text=f"Error calculating payouts: {str(e)}")
+            self._error_label.pack(pady=10)
     
     def display_pool_summary(self, prize_pool, food_pool, bounty_pool, total_pool):
-        """Display the pool summary at the top of results"""
-        summary_frame = ctk.CTkFrame(self.results_scroll, fg_color=POKER_COLORS["dark_green"])
-        summary_frame.pack(fill="x", pady=(0, 15), padx=10)
-        
-        ctk.CTkLabel(
-            summary_frame,
-            text="💰 Pool Summary",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=POKER_COLORS["gold"]
-        ).pack(pady=(10, 5))
-        
-        ctk.CTkLabel(
-            summary_frame,
-            text=f"Prize Pool: ${prize_pool:.2f}",
-            font=ctk.CTkFont(size=12),
-            text_color=POKER_COLORS["card_white"]
-        ).pack()
-        
+        """Update the pool summary labels in place"""
+        lines = [f"Prize Pool: ${prize_pool:.2f}"]
         if food_pool > 0:
-            ctk.CTkLabel(
-                summary_frame,
-                text=f"Food Pool: ${food_pool:.2f}",
-                font=ctk.CTkFont(size=12),
-                text_color=POKER_COLORS["card_white"]
-            ).pack()
-        
+            lines.append(f"Food Pool: ${food_pool:.2f}")
         if bounty_pool > 0:
-            ctk.CTkLabel(
-                summary_frame,
-                text=f"Bounty Pool: ${bounty_pool:.2f}",
-                font=ctk.CTkFont(size=12),
-                text_color=POKER_COLORS["card_white"]
-            ).pack()
-        
-        ctk.CTkLabel(
-            summary_frame,
-            text=f"Total Pool: ${total_pool:.2f}",
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=POKER_COLORS["gold"]
-        ).pack(pady=(5, 10))
-    
+            lines.append(f"Bounty Pool: ${bounty_pool:.2f}")
+
+        self._configure_text(self._pools_label, "\n".join(lines))
+        self._configure_text(self._total_pool_summary_label, f"Total Pool: ${total_pool:.2f}")
+
+    def _add_payout_row(self):
+        """Create one pooled payout row (hidden until configured)"""
+        # Grid with fixed column weights and a fixed frame height resolves
+        # the row in a single layout pass; side-packed labels would force
+        # an extra content-driven negotiation per text change
+        payout_frame = ctk.CTkFrame(self._rows_container, fg_color=POKER_COLORS.light_green, height=48)
+        payout_frame.grid_columnconfigure(0, weight=1)
+        payout_frame.grid_propagate(False)
+
+        position_label = self.create_label(payout_frame, "", size=14, weight="bold")
+        position_label.grid(row=0, column=0, sticky="w", padx=15, pady=10)
+
+        weight_label = self.create_label(payout_frame, "", size=10)
+        weight_label.grid(row=0, column=1, sticky="e", padx=5, pady=10)
+
+        payout_label = self.create_label(payout_frame, "", size=16, weight="bold", color="gold")
+        payout_label.grid(row=0, column=2, sticky="e", padx=15, pady=10)
+
+        self._payout_rows.append({
+            'frame': payout_frame,
+            'position': position_label,
+            'payout': payout_label,
+            'weight': weight_label,
+            'visible': False
+        })
+
     def create_payout_row(self, position, payout, weight):
-        """Create a payout row for a specific position"""
-        payout_frame = ctk.CTkFrame(self.results_scroll, fg_color=POKER_COLORS["light_green"])
-        payout_frame.pack(fill="x", pady=2, padx=10)
-        
+        """Show the payout row for a position, reusing pooled widgets"""
+        if position > len(self._payout_rows):
+            self._add_payout_row()
+        row = self._payout_rows[position - 1]
+
         # Position emojis
-        position_emojis = ["🥇", "🥈", "🥉"] + ["🏅"] * 20
-        emoji = position_emojis[position - 1] if position - 1 < len(position_emojis) else "🏅"
-        
-        # Position label
-        position_text = f"{emoji} {self.get_position_suffix(position)} Place"
-        ctk.CTkLabel(
-            payout_frame,
-            text=position_text,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            text_color=POKER_COLORS["card_white"]
-        ).pack(side="left", padx=15, pady=10)
-        
-        # Payout amount
-        ctk.CTkLabel(
-            payout_frame,
-            text=f"${payout:.2f}",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=POKER_COLORS["gold"]
-        ).pack(side="right", padx=15, pady=10)
-        
-        # Weight indicator
-        ctk.CTkLabel(
-            payout_frame,
-            text=f"(Weight: {weight})",
-            font=ctk.CTkFont(size=10),
-            text_color=POKER_COLORS["card_white"]
-        ).pack(side="right", padx=5, pady=10)
-    
+        emoji = _POSITION_EMOJIS[position - 1] if position - 1 < len(_POSITION_EMOJIS) else _FALLBACK_EMOJI
+
+        self._configure_text(row['position'], f"{emoji} {self.get_position_suffix(position)} Place")
+        self._configure_text(row['payout'], f"${payout:.2f}")
+        self._configure_text(row['weight'], f"(Weight: {weight})")
+
+        # Visible rows are always a prefix of the pool, so packing in
+        # ascending position order keeps them sorted
+        if not row['visible']:
+            row['frame'].pack(fill="x", pady=2, padx=10)
+            row['visible'] = True
+
     def display_bounty_info(self, bounty_per_player, bounty_pool):
-        """Display bounty information"""
-        bounty_frame = ctk.CTkFrame(self.results_scroll, fg_color=POKER_COLORS["medium_green"])
-        bounty_frame.pack(fill="x", pady=(15, 0), padx=10)
-        
-        ctk.CTkLabel(
-            bounty_frame,
-            text="🎯 Bounty Information",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=POKER_COLORS["gold"]
-        ).pack(pady=(10, 5))
-        
-        ctk.CTkLabel(
-            bounty_frame,
-            text=f"Bounty per knockout: ${bounty_per_player:.2f}",
-            font=ctk.CTkFont(size=12),
-            text_color=POKER_COLORS["card_white"]
-        ).pack()
-        
-        ctk.CTkLabel(
-            bounty_frame,
-            text=f"Total bounty pool: ${bounty_pool:.2f}",
-            font=ctk.CTkFont(size=12),
-            text_color=POKER_COLORS["card_white"]
-        ).pack(pady=(0, 10))
+        """Update the bounty info labels in place"""
+        self._configure_text(self._bounty_per_ko_label, f"Bounty per knockout: ${bounty_per_player:.2f}")
+        self._configure_text(self._bounty_total_label, f"Total bounty pool: ${bounty_pool:.2f}")
+        if not self._bounty_frame_visible:
+            self._bounty_frame.pack(fill="x", pady=(15, 0), padx=10)
+            self._bounty_frame_visible = True
     
     def open_weights_window(self):
         """Open the weights customization window"""
         if self.weights_window and self.weights_window.winfo_exists():
-            self.weights_window.lift()
+            self.weights_window.show(self.current_weights)
         else:
             self.weights_window = WeightsWindow(
                 self.root, 
@@ -877,18 +1168,47 @@ class PokerPayoutCalculator:
                 self.update_weights_callback
             )
     
+    def _configure_text(self, label, text):
+        """Set a label's text only when it changed - an idempotent configure
+        still pays a Tcl round-trip"""
+        if self._label_text_cache.get(label) != text:
+            self._label_text_cache[label] = text
+            label.configure(text=text)
+
+    def _set_var_text(self, var, text):
+        """Write a label's StringVar only when its text changed"""
+        # Key on the Tcl variable name: Variable defines __eq__ without
+        # __hash__, so the var object itself can't be a dict key
+        key = var._name
+        if self._label_text_cache.get(key) != text:
+            self._label_text_cache[key] = text
+            var.set(text)
+
+    def refresh_weights_summary(self):
+        """Update the weights summary label, skipping redundant redraws"""
+        text = self.get_weights_summary()
+        if text != self._last_weights_summary:
+            self._last_weights_summary = text
+            self.weights_summary.configure(text=text)
+
     def reset_weights(self):
         """Reset weights to default values"""
         self.current_weights = self.default_weights.copy()
-        self.weights_summary.configure(text=self.get_weights_summary())
+        self._weights_summary_cache = None
+        self._weights_tuple = None
+        self.refresh_weights_summary()
         if self.weights_window and self.weights_window.winfo_exists():
             self.weights_window.update_weights_display(self.current_weights)
         self.calculate_payouts()
-    
+
     def update_weights_callback(self, new_weights):
         """Callback function for when weights are updated"""
+        # The window hands over an immutable tuple snapshot; tuple() on it
+        # in weights_key() is then a no-op rather than a copy
         self.current_weights = new_weights
-        self.weights_summary.configure(text=self.get_weights_summary())
+        self._weights_summary_cache = None
+        self._weights_tuple = None
+        self.refresh_weights_summary()
         self.calculate_payouts()
         
     def setup_timer(self, parent):
@@ -902,22 +1222,22 @@ class PokerPayoutCalculator:
         )
         
         # Game duration setting
-        duration_frame = ctk.CTkFrame(parent, fg_color=POKER_COLORS["light_green"])
+        duration_frame = ctk.CTkFrame(parent, fg_color=POKER_COLORS.light_green)
         duration_frame.pack(fill="x", padx=15, pady=(0, 10))
         
         ctk.CTkLabel(
             duration_frame,
             text="Game Duration (minutes):",
-            font=ctk.CTkFont(size=12, weight="bold"),
-            text_color=POKER_COLORS["card_white"]
+            font=_get_font(12, "bold"),
+            text_color=POKER_COLORS.card_white
         ).pack(pady=(10, 5))
         
         duration_entry = ctk.CTkEntry(
             duration_frame,
             textvariable=self.game_duration,
             width=100,
-            fg_color=POKER_COLORS["dark_green"],
-            border_color=POKER_COLORS["accent_green"],
+            fg_color=POKER_COLORS.dark_green,
+            border_color=POKER_COLORS.accent_green,
             justify="center"
         )
         duration_entry.pack(pady=(0, 10))
@@ -932,9 +1252,9 @@ class PokerPayoutCalculator:
             variable=self.timer_direction,
             value="countdown",
             command=self.reset_timer,
-            fg_color=POKER_COLORS["accent_green"],
-            hover_color=POKER_COLORS["medium_green"],
-            text_color=POKER_COLORS["card_white"]
+            fg_color=POKER_COLORS.accent_green,
+            hover_color=POKER_COLORS.medium_green,
+            text_color=POKER_COLORS.card_white
         )
         countdown_radio.pack(side="left", padx=5)
         
@@ -944,21 +1264,21 @@ class PokerPayoutCalculator:
             variable=self.timer_direction,
             value="countup",
             command=self.reset_timer,
-            fg_color=POKER_COLORS["accent_green"],
-            hover_color=POKER_COLORS["medium_green"],
-            text_color=POKER_COLORS["card_white"]
+            fg_color=POKER_COLORS.accent_green,
+            hover_color=POKER_COLORS.medium_green,
+            text_color=POKER_COLORS.card_white
         )
         countup_radio.pack(side="left", padx=5)
         
         # Timer display
-        timer_display_frame = ctk.CTkFrame(parent, fg_color=POKER_COLORS["felt_green"])
+        timer_display_frame = ctk.CTkFrame(parent, fg_color=POKER_COLORS.felt_green)
         timer_display_frame.pack(fill="x", padx=15, pady=10)
         
         self.timer_display = ctk.CTkLabel(
             timer_display_frame,
-            text="3:00:00",
-            font=ctk.CTkFont(size=36, weight="bold"),
-            text_color=POKER_COLORS["gold"]
+            textvariable=self._timer_text,
+            font=_get_font(36, "bold"),
+            text_color=POKER_COLORS.gold
         )
         self.timer_display.pack(pady=20)
         
@@ -967,8 +1287,8 @@ class PokerPayoutCalculator:
             timer_display_frame,
             width=280,
             height=15,
-            fg_color=POKER_COLORS["dark_green"],
-            progress_color=POKER_COLORS["accent_green"]
+            fg_color=POKER_COLORS.dark_green,
+            progress_color=POKER_COLORS.accent_green
         )
         self.timer_progress.pack(pady=(0, 15))
         
@@ -980,8 +1300,8 @@ class PokerPayoutCalculator:
             button_frame,
             text="▶️ Start",
             command=self.toggle_timer,
-            fg_color=POKER_COLORS["accent_green"],
-            hover_color=POKER_COLORS["medium_green"],
+            fg_color=POKER_COLORS.accent_green,
+            hover_color=POKER_COLORS.medium_green,
             width=80
         )
         self.start_pause_btn.pack(side="left", padx=5)
@@ -990,8 +1310,8 @@ class PokerPayoutCalculator:
             button_frame,
             text="🔄 Reset",
             command=self.reset_timer,
-            fg_color=POKER_COLORS["medium_green"],
-            hover_color=POKER_COLORS["dark_green"],
+            fg_color=POKER_COLORS.medium_green,
+            hover_color=POKER_COLORS.dark_green,
             width=80
         )
         reset_btn.pack(side="left", padx=5)
@@ -1017,6 +1337,13 @@ class PokerPayoutCalculator:
         )
         placeholder_label.pack(expand=True)
 
+    def _on_duration_change(self, *args):
+        """Keep the seconds mirror of the duration entry fresh"""
+        try:
+            self._duration_seconds = self.game_duration.get() * 60
+        except tk.TclError:
+            pass  # Partial input - keep the last good value
+
     def toggle_timer(self):
         """Start or pause the timer"""
         if self.timer_running:
@@ -1028,6 +1355,7 @@ class PokerPayoutCalculator:
         """Start the timer"""
         self.timer_running = True
         self.start_pause_btn.configure(text="⏸️ Pause")
+        self._next_tick = time.monotonic() + 1.0
         self.update_timer()
 
     def pause_timer(self):
@@ -1040,8 +1368,11 @@ class PokerPayoutCalculator:
     def reset_timer(self):
         """Reset the timer"""
         self.pause_timer()
+        if self._flash_job is not None:
+            self.root.after_cancel(self._flash_job)
+            self._flash_job = None
         if self.timer_direction.get() == "countdown":
-            self.current_time = self.game_duration.get() * 60  # Convert to seconds
+            self.current_time = self._duration_seconds
         else:
             self.current_time = 0
         self.update_timer_display()
@@ -1057,56 +1388,75 @@ class PokerPayoutCalculator:
                     self.flash_timer_red()
             else:
                 self.current_time += 1
-                max_time = self.game_duration.get() * 60
+                max_time = self._duration_seconds
                 if self.current_time >= max_time:
                     self.current_time = max_time
                     self.pause_timer()
                     self.flash_timer_red()
             
             self.update_timer_display()
-            self.timer_job = self.root.after(1000, self.update_timer)
+            if self.timer_running:
+                # A flat after(1000) accumulates callback latency into real
+                # drift over a 3-hour game; aim at the monotonic deadline
+                self._next_tick += 1.0
+                delay_ms = max(1, int((self._next_tick - time.monotonic()) * 1000))
+                self.timer_job = self.root.after(delay_ms, self.update_timer)
 
     def update_timer_display(self):
         """Update the timer display and progress bar"""
-        # Format time display
-        hours = self.current_time // 3600
-        minutes = (self.current_time % 3600) // 60
-        seconds = self.current_time % 60
+        # Format time with two divmods instead of three mod/floordiv pairs
+        minutes, seconds = divmod(self.current_time, 60)
+        hours, minutes = divmod(minutes, 60)
         time_str = f"{hours}:{minutes:02d}:{seconds:02d}"
-        
-        self.timer_display.configure(text=time_str)
-        
-        # Update progress bar
-        total_time = self.game_duration.get() * 60
+
+        if time_str != self._last_time_str:
+            self._last_time_str = time_str
+            self._timer_text.set(time_str)
+
+        # One Tcl read for the direction, the cached duration mirror, and
+        # one ratio that feeds both the progress bar and the warning color
+        total_time = self._duration_seconds
+        countdown = self.timer_direction.get() == "countdown"
+        remaining_ratio = self.current_time / total_time if total_time > 0 else 0
+
         if total_time > 0:
-            if self.timer_direction.get() == "countdown":
-                progress = 1 - (self.current_time / total_time)
-            else:
-                progress = self.current_time / total_time
-            self.timer_progress.set(progress)
+            progress = 1 - remaining_ratio if countdown else remaining_ratio
         else:
-            self.timer_progress.set(0)
-        
-        # Change color based on time remaining
-        if self.timer_direction.get() == "countdown":
-            time_remaining_ratio = self.current_time / (self.game_duration.get() * 60) if self.game_duration.get() > 0 else 0
-            if time_remaining_ratio <= 0.1:  # Last 10%
-                self.timer_display.configure(text_color="#FF4444")  # Red
-            elif time_remaining_ratio <= 0.25:  # Last 25%
-                self.timer_display.configure(text_color="#FFA500")  # Orange
-            else:
-                self.timer_display.configure(text_color=POKER_COLORS["gold"])
+            progress = 0
+
+        # Sub-pixel changes can't render on the 280-px bar; for a 3-hour
+        # game this trims ~10800 set() calls down to ~280
+        pixel = int(progress * 280)
+        if pixel != self._last_progress_pixel:
+            self._last_progress_pixel = pixel
+            self.timer_progress.set(pixel / 280)
+
+        if countdown and remaining_ratio <= 0.25:
+            color = "#FF4444" if remaining_ratio <= 0.1 else "#FFA500"  # Red / Orange
         else:
-            self.timer_display.configure(text_color=POKER_COLORS["gold"])
+            color = POKER_COLORS.gold
+
+        if color != self._last_timer_color:
+            self._last_timer_color = color
+            self.timer_display.configure(text_color=color)
 
     def flash_timer_red(self):
         """Flash the timer red when time is up"""
-        def flash(count=0):
-            if count < 6:  # Flash 3 times
-                color = "#FF0000" if count % 2 == 0 else POKER_COLORS["gold"]
-                self.timer_display.configure(text_color=color)
-                self.root.after(300, lambda: flash(count + 1))
-        flash()
+        if self._flash_job is not None:
+            self.root.after_cancel(self._flash_job)
+        self._flash_count = 0
+        self._flash_step()
+
+    def _flash_step(self):
+        """Run one flash transition; reschedules itself until done"""
+        self._flash_job = None
+        if self._flash_count >= 6:  # Flash 3 times
+            return
+        color = "#FF0000" if self._flash_count % 2 == 0 else POKER_COLORS.gold
+        self._last_timer_color = color
+        self.timer_display.configure(text_color=color)
+        self._flash_count += 1
+        self._flash_job = self.root.after(300, self._flash_step)
         
     def run(self):
         """Start the application"""
@@ -1115,18 +1465,31 @@ class PokerPayoutCalculator:
 
 class WeightsWindow:
     def __init__(self, parent, current_weights, update_callback):
+        _init_gui()
         self.update_callback = update_callback
-        self.current_weights = current_weights.copy()
-        
+        self.current_weights = list(current_weights)
+
+        # Pending debounced weight commit (after() handle)
+        self._pending_job = None
+
         # Create weights window
         self.window = ctk.CTkToplevel(parent)
         self.window.title("🎰 Customize Payout Weights")
-        self.window.geometry("500x600")
-        self.window.configure(fg_color=POKER_COLORS["felt_green"])
+        self.window.configure(fg_color=POKER_COLORS.felt_green)
         self.window.transient(parent)
-        
-        # Center the window
-        self.window.update_idletasks()
+
+        # Closing hides the window; reopening deiconifies it instead of
+        # paying Toplevel construction and UI setup again
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Liveness flag, flipped by <Destroy>, so the existence checks on
+        # every open/reset skip the Tcl round-trip and its except path
+        self._destroyed = False
+        self.window.bind("<Destroy>", self._on_destroy, add="+")
+
+        # Center over the parent with a single geometry call - only the
+        # parent's dimensions matter, so no extra layout pass on the dialog
+        parent.update_idletasks()
         x = parent.winfo_x() + (parent.winfo_width() // 2) - (250)
         y = parent.winfo_y() + (parent.winfo_height() // 2) - (300)
         self.window.geometry(f"500x600+{x}+{y}")
@@ -1139,8 +1502,8 @@ class WeightsWindow:
         title = ctk.CTkLabel(
             self.window, 
             text="🎰 Customize Payout Weights", 
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=POKER_COLORS["gold"]
+            font=_get_font(20, "bold"),
+            text_color=POKER_COLORS.gold
         )
         title.pack(pady=20)
         
@@ -1148,33 +1511,42 @@ class WeightsWindow:
         instructions = ctk.CTkLabel(
             self.window,
             text="Adjust the payout weights for each position.\nHigher weights = bigger payouts.",
-            font=ctk.CTkFont(size=12),
-            text_color=POKER_COLORS["card_white"]
+            font=_get_font(12),
+            text_color=POKER_COLORS.card_white
         )
         instructions.pack(pady=10)
         
         # Scrollable frame for weight entries
         self.weights_frame = ctk.CTkScrollableFrame(
             self.window,
-            fg_color=POKER_COLORS["dark_green"],
+            fg_color=POKER_COLORS.dark_green,
             height=350
         )
         self.weights_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
-        # Weight entry widgets
+        # Tcl-side key validation: non-numeric keystrokes are rejected
+        # inside Tcl and never fire a variable trace into Python
+        self._validate_digits = self.window.register(self._digits_only)
+
+        # Pooled weight entry rows - add/remove/reset reuse these widgets
+        # instead of destroying and reconstructing them
         self.weight_entries = []
+        self._entry_rows = []
+        self._visible_entry_rows = 0
+        self._loading = False
+        self._button_frame = None  # Not built yet; remaps need it as an anchor
         self.create_weight_entries()
-        
+
         # Buttons
-        button_frame = ctk.CTkFrame(self.window, fg_color="transparent")
+        button_frame = self._button_frame = ctk.CTkFrame(self.window, fg_color="transparent")
         button_frame.pack(pady=20)
         
         add_position_btn = ctk.CTkButton(
             button_frame,
             text="➕ Add Position",
             command=self.add_position,
-            fg_color=POKER_COLORS["accent_green"],
-            hover_color=POKER_COLORS["medium_green"]
+            fg_color=POKER_COLORS.accent_green,
+            hover_color=POKER_COLORS.medium_green
         )
         add_position_btn.pack(side="left", padx=5)
         
@@ -1182,102 +1554,182 @@ class WeightsWindow:
             button_frame,
             text="➖ Remove Last",
             command=self.remove_position,
-            fg_color=POKER_COLORS["medium_green"],
-            hover_color=POKER_COLORS["dark_green"]
+            fg_color=POKER_COLORS.medium_green,
+            hover_color=POKER_COLORS.dark_green
         )
         remove_position_btn.pack(side="left", padx=5)
         
         close_btn = ctk.CTkButton(
             button_frame,
             text="✅ Done",
-            command=self.window.destroy,
-            fg_color=POKER_COLORS["gold"],
-            hover_color=POKER_COLORS["accent_green"],
-            text_color=POKER_COLORS["dark_green"]
+            command=self._on_close,
+            fg_color=POKER_COLORS.gold,
+            hover_color=POKER_COLORS.accent_green,
+            text_color=POKER_COLORS.dark_green
         )
         close_btn.pack(side="left", padx=5)
         
     def create_weight_entries(self):
-        """Create weight entry widgets"""
-        for widget in self.weights_frame.winfo_children():
-            widget.destroy()
-        self.weight_entries.clear()
-        
-        for i, weight in enumerate(self.current_weights):
-            position_frame = ctk.CTkFrame(self.weights_frame, fg_color=POKER_COLORS["light_green"])
-            position_frame.pack(fill="x", pady=5, padx=10)
-            
-            position_emojis = ["🥇", "🥈", "🥉"] + ["🏅"] * 20
-            emoji = position_emojis[i] if i < len(position_emojis) else "🏅"
-            
-            ctk.CTkLabel(
-                position_frame,
-                text=f"{emoji} {self.get_position_suffix(i+1)} Place:",
-                font=ctk.CTkFont(size=12, weight="bold"),
-                text_color=POKER_COLORS["card_white"]
-            ).pack(side="left", padx=10, pady=10)
-            
-            weight_var = tk.IntVar(value=weight)
-            weight_var.trace_add("write", lambda *args, idx=i: self.on_weight_change(idx))
-            
-            weight_entry = ctk.CTkEntry(
-                position_frame,
-                textvariable=weight_var,
-                width=80,
-                fg_color=POKER_COLORS["dark_green"],
-                border_color=POKER_COLORS["accent_green"]
-            )
-            weight_entry.pack(side="right", padx=10, pady=10)
-            
-            self.weight_entries.append(weight_var)
-            
+        """Sync the pooled weight entry rows to the current weights"""
+        # Loading values into the IntVars fires their traces; suppress the
+        # change handler while the rows are populated programmatically
+        self._loading = True
+        # When the row count changes, unmap the scroll frame so pack lays
+        # the whole batch out once at the remap instead of once per row,
+        # as the results and bank panels do; value-only syncs skip this
+        rows_changing = len(self.current_weights) != self._visible_entry_rows
+        if rows_changing:
+            self.weights_frame.pack_forget()
+        try:
+            self.weight_entries.clear()
+            for i, weight in enumerate(self.current_weights):
+                if i >= len(self._entry_rows):
+                    self._add_entry_row(i)
+                row = self._entry_rows[i]
+                row['var'].set(weight)
+                self.weight_entries.append(row['var'])
+                if not row['visible']:
+                    row['frame'].pack(fill="x", pady=5, padx=10)
+                    row['visible'] = True
+
+            # Hide pooled rows past the current position count
+            for row in self._entry_rows[len(self.current_weights):]:
+                if row['visible']:
+                    row['frame'].pack_forget()
+                    row['visible'] = False
+        finally:
+            if rows_changing:
+                # Remap above the button row (absent only during setup)
+                if self._button_frame is not None:
+                    self.weights_frame.pack(fill="both", expand=True, padx=20, pady=10,
+                                            before=self._button_frame)
+                else:
+                    self.weights_frame.pack(fill="both", expand=True, padx=20, pady=10)
+                self._visible_entry_rows = len(self.current_weights)
+            self._loading = False
+
+    def _add_entry_row(self, index):
+        """Create one pooled weight entry row (hidden until packed)"""
+        position_frame = ctk.CTkFrame(self.weights_frame, fg_color=POKER_COLORS.light_green)
+
+        emoji = _POSITION_EMOJIS[index] if index < len(_POSITION_EMOJIS) else _FALLBACK_EMOJI
+
+        # The label text depends only on the row's fixed position, so it
+        # never needs reconfiguring on reuse
+        ctk.CTkLabel(
+            position_frame,
+            text=f"{emoji} {self.get_position_suffix(index + 1)} Place:",
+            font=_get_font(12, "bold"),
+            text_color=POKER_COLORS.card_white
+        ).pack(side="left", padx=10, pady=10)
+
+        weight_var = tk.IntVar(value=0)
+        # partial() binds the row index without allocating a closure and a
+        # default-arg tuple per row, matching the bank checkbox commands
+        weight_var.trace_add("write", partial(self.on_weight_change, index))
+
+        weight_entry = ctk.CTkEntry(
+            position_frame,
+            textvariable=weight_var,
+            width=80,
+            fg_color=POKER_COLORS.dark_green,
+            border_color=POKER_COLORS.accent_green,
+            validate="key",
+            validatecommand=(self._validate_digits, "%P")
+        )
+        weight_entry.pack(side="right", padx=10, pady=10)
+
+        self._entry_rows.append({
+            'frame': position_frame,
+            'var': weight_var,
+            'visible': False
+        })
+
+    @staticmethod
+    def _digits_only(proposed):
+        """Key validator - accept only empty or all-digit entry text"""
+        return proposed == "" or proposed.isdigit()
+
     def get_position_suffix(self, position: int) -> str:
         """Get the appropriate suffix for position numbers"""
-        if 10 <= position % 100 <= 20:
-            suffix = "th"
-        else:
-            suffix = {1: "st", 2: "nd", 3: "rd"}.get(position % 10, "th")
-        return f"{position}{suffix}"
-        
-    def on_weight_change(self, index):
-        """Handle weight change"""
-        try:
-            new_weight = self.weight_entries[index].get()
-            if new_weight > 0:
-                self.current_weights[index] = new_weight
-                self.update_callback(self.current_weights.copy())
-        except (ValueError, tk.TclError):
-            pass
+        return _position_label(position)
+
+    def on_weight_change(self, index, *args):
+        """Coalesce weight edits into one deferred commit"""
+        if self._loading:
+            return
+        # Typing "25" fires the trace per keystroke; commit once after the
+        # input settles instead of recalculating per character
+        if self._pending_job is not None:
+            self.window.after_cancel(self._pending_job)
+        self._pending_job = self.window.after(150, self._commit_weights)
+
+    def _commit_weights(self):
+        """Push the settled entry values through to the main window"""
+        self._pending_job = None
+        changed = False
+        for i, var in enumerate(self.weight_entries):
+            try:
+                new_weight = var.get()
+            except (ValueError, tk.TclError):
+                continue
+            if new_weight > 0 and self.current_weights[i] != new_weight:
+                self.current_weights[i] = new_weight
+                changed = True
+        if changed:
+            self.update_callback(tuple(self.current_weights))
             
     def add_position(self):
         """Add a new position"""
         self.current_weights.append(1)
         self.create_weight_entries()
-        self.update_callback(self.current_weights.copy())
+        self.update_callback(tuple(self.current_weights))
         
     def remove_position(self):
         """Remove the last position"""
         if len(self.current_weights) > 1:
             self.current_weights.pop()
             self.create_weight_entries()
-            self.update_callback(self.current_weights.copy())
+            self.update_callback(tuple(self.current_weights))
             
     def update_weights_display(self, new_weights):
         """Update the weights display"""
-        self.current_weights = new_weights.copy()
+        self.current_weights = list(new_weights)
         self.create_weight_entries()
         
+    def _on_close(self):
+        """Flush any pending edit so it isn't lost, then hide the window"""
+        if self._pending_job is not None:
+            self.window.after_cancel(self._pending_job)
+            self._commit_weights()
+        self.window.withdraw()
+
+    def _on_destroy(self, event):
+        """Record teardown - <Destroy> also fires per child, so filter"""
+        if event.widget is self.window:
+            self._destroyed = True
+            # Don't let a pending commit fire against dead widgets
+            if self._pending_job is not None:
+                try:
+                    self.window.after_cancel(self._pending_job)
+                except tk.TclError:
+                    pass
+                self._pending_job = None
+
     def winfo_exists(self):
         """Check if window exists"""
-        try:
-            return self.window.winfo_exists()
-        except:
-            return False
+        return not self._destroyed
             
     def lift(self):
         """Bring window to front"""
         self.window.lift()
 
+    def show(self, weights):
+        """Re-show the hidden window, synced to the latest weights"""
+        self.update_weights_display(weights)
+        self.window.deiconify()
+        self.window.lift()
+
 
 if __name__ == "__main__":
     app = PokerPayoutCalculator()